@@ -2,9 +2,16 @@ import pygame
 import random
 import sys
 import math
+import numpy as np
+from collections import deque
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Deque, Dict, List, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; particle physics falls back to NumPy
+    njit = None
 
 # Initialize Pygame
 pygame.init()
@@ -13,12 +20,17 @@ pygame.init()
 SCREEN_WIDTH = 400
 SCREEN_HEIGHT = 600
 FPS = 60
+PHYSICS_STEP = 1 / FPS
+RENDER_FPS = 120
+MAX_FRAME_TIME = 0.25
 GRAVITY = 0.4
 FLAP_POWER = -9
 PIPE_VELOCITY = -4
 PIPE_GAP = 120
+PIPE_WIDTH = 50
 MIN_PIPE_HEIGHT = 50
 MAX_PIPE_HEIGHT = SCREEN_HEIGHT - PIPE_GAP - MIN_PIPE_HEIGHT
+INPUT_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]
 
 # Colors (HSL-inspired palette)
 COLOR_BG_DARK = (20, 25, 35)
@@ -34,6 +46,16 @@ COLOR_GROUND_DARK = (101, 50, 15)
 COLOR_TEXT = (255, 255, 255)
 COLOR_SCORE = (255, 215, 0)
 COLOR_SHADOW = (0, 0, 0, 100)
+COLOR_SPARKS = [(255, 200, 100), (255, 160, 80), (240, 120, 60),
+                (220, 180, 140), (200, 100, 50), (255, 140, 120)]
+
+# Game fonts by name, registered by Game so text can be cached by hashable keys
+_FONTS: Dict[str, pygame.font.Font] = {}
+
+@lru_cache(maxsize=256)
+def _render_text(font_id: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    # Text rarely changes between frames, so reuse the rendered surface
+    return _FONTS[font_id].render(text, True, color).convert_alpha()
 
 class GameState(Enum):
     MENU = 1
@@ -41,208 +63,386 @@ class GameState(Enum):
     GAME_OVER = 3
     PAUSED = 4
 
-@dataclass
-class Particle:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    size: float
-    lifetime: float
-    color: Tuple[int, int, int]
+if njit is not None:
+    # An explicit signature compiles the kernel at import, not mid-game on the first flap
+    @njit("void(f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], f8, i8)", cache=True, fastmath=True)
+    def _step_particles(x, y, vx, vy, size, life, dt, n):
+        for i in range(n):
+            x[i] += vx[i]
+            y[i] += vy[i]
+            vy[i] += 0.2
+            life[i] -= dt
+            size[i] *= 0.98
+else:
+    def _step_particles(x, y, vx, vy, size, life, dt, n):
+        x[:n] += vx[:n]
+        y[:n] += vy[:n]
+        vy[:n] += 0.2
+        life[:n] -= dt
+        size[:n] *= 0.98
+
+class ParticleSystem:
+    """Particles stored as parallel NumPy arrays so a whole batch updates at once."""
+    
+    __slots__ = ("count", "x", "y", "vx", "vy", "size", "life", "color")
+    
+    MAX_RADIUS = 7
+    # Pre-rendered circle sprites shared by every system, keyed by (color, radius)
+    _sprites: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
+    
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+    
+    def _arrays(self) -> Tuple[np.ndarray, ...]:
+        return (self.x, self.y, self.vx, self.vy, self.size, self.life, self.color)
+    
+    def _reserve(self, n: int):
+        capacity = len(self.x)
+        needed = self.count + n
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("x", "y", "vx", "vy", "size", "life", "color"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+    
+    def spawn_many(self, n: int, x: float, y: float, vx: np.ndarray, vy: np.ndarray,
+                   size: np.ndarray, lifetime: float, color):
+        self._reserve(n)
+        batch = slice(self.count, self.count + n)
+        self.x[batch] = x
+        self.y[batch] = y
+        self.vx[batch] = vx
+        self.vy[batch] = vy
+        self.size[batch] = size
+        self.life[batch] = lifetime
+        self.color[batch] = color
+        self.count += n
+    
+    def spawn_burst(self, n: int, x: float, y: float, angle_range: Tuple[float, float],
+                    speed_range: Tuple[float, float], size_range: Tuple[float, float],
+                    lifetime: float, color):
+        # A single RNG call draws the angle, speed and size of every particle
+        angles, speeds, sizes = np.random.uniform(
+            (angle_range[0], speed_range[0], size_range[0]),
+            (angle_range[1], speed_range[1], size_range[1]),
+            size=(n, 3)
+        ).T
+        self.spawn_many(n, x, y, np.cos(angles) * speeds, np.sin(angles) * speeds,
+                        sizes, lifetime, color)
     
     def update(self, dt: float):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.2
-        self.lifetime -= dt
-        self.size *= 0.98
+        n = self.count
+        if n == 0:
+            return
+        _step_particles(self.x, self.y, self.vx, self.vy, self.size, self.life, dt, n)
+        
+        # Retire expired particles: survivors past the new end fill the holes left
+        # before it, so only as many slots are copied as particles expired
+        alive = self.life[:n] > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            holes = np.flatnonzero(~alive[:remaining])
+            movers = np.flatnonzero(alive[remaining:]) + remaining
+            if len(holes):
+                for array in self._arrays():
+                    array[holes] = array[movers]
+            self.count = remaining
+    
+    @classmethod
+    def _sprite(cls, color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+        key = (color, radius)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            cls._sprites[key] = sprite
+        return sprite
     
     def draw(self, surface: pygame.Surface):
-        if self.lifetime > 0:
-            alpha = int(255 * (self.lifetime / 1.0))
-            color = (*self.color, alpha)
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), max(1, int(self.size)))
+        n = self.count
+        if n == 0:
+            return
+        
+        # Blit cached circle sprites in one batch instead of rasterizing each particle
+        radii = np.clip(self.size[:n], 1, self.MAX_RADIUS).astype(np.int32)
+        left = self.x[:n].astype(np.int32) - radii
+        top = self.y[:n].astype(np.int32) - radii
+        sprite = self._sprite
+        surface.blits([
+            (sprite(color, radius), (x, y))
+            for x, y, radius, color in zip(left.tolist(), top.tolist(), radii.tolist(),
+                                           map(tuple, self.color[:n].tolist()))
+        ], doreturn=False)
 
 class Bird:
+    # Fixed attribute slots keep the per-frame attribute reads and writes cheap
+    __slots__ = ("x", "y", "velocity", "rotation", "size", "flap_cooldown", "particles",
+                 "prev_y", "prev_rotation")
+    
+    # The bird sprite pre-rotated in 5 degree steps across its -30..90 range
+    _rotations: List[pygame.Surface] = []
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
         self.velocity = 0
         self.rotation = 0
+        self.prev_y = y
+        self.prev_rotation = 0
         self.size = 16
         self.flap_cooldown = 0
-        self.particles: List[Particle] = []
+        self.particles = ParticleSystem()
+        if not Bird._rotations:
+            base = self.render_sprite()
+            Bird._rotations = [pygame.transform.rotate(base, -angle) for angle in range(-30, 91, 5)]
+    
+    def render_sprite(self) -> pygame.Surface:
+        # The bird only ever changes by rotation, so draw it once at angle 0
+        sprite = pygame.Surface((40, 40), pygame.SRCALPHA).convert_alpha()
+        center = (20, 20)
+        
+        # Draw bird body (circle)
+        pygame.draw.circle(sprite, COLOR_BIRD, center, self.size)
+        pygame.draw.circle(sprite, COLOR_BIRD_DARK, center, self.size, 2)
+        
+        # Draw eye
+        eye_x = center[0] + 6
+        eye_y = center[1] - 4
+        pygame.draw.circle(sprite, (0, 0, 0), (eye_x, eye_y), 3)
+        pygame.draw.circle(sprite, (255, 255, 255), (eye_x - 1, eye_y - 1), 1)
+        
+        # Draw wing
+        wing_points = [
+            (center[0] + 8, center[1] - 2),
+            (center[0] + 18, center[1] - 5),
+            (center[0] + 15, center[1] + 5)
+        ]
+        pygame.draw.polygon(sprite, COLOR_BIRD_DARK, wing_points)
         
+        return sprite
+    
     def flap(self):
         if self.flap_cooldown <= 0:
             self.velocity = FLAP_POWER
             self.flap_cooldown = 0.1
             # Generate flap particles
-            for _ in range(5):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(2, 5)
-                self.particles.append(Particle(
-                    self.x, self.y,
-                    math.cos(angle) * speed,
-                    math.sin(angle) * speed,
-                    random.uniform(2, 4),
-                    0.5,
-                    (255, 200, 87)
-                ))
+            self.particles.spawn_burst(
+                5, self.x, self.y,
+                (0, 2 * math.pi), (2, 5), (2, 4),
+                0.5,
+                (255, 200, 87)
+            )
     
     def update(self, dt: float):
-        self.velocity += GRAVITY
-        self.y += self.velocity
+        velocity = self.velocity + GRAVITY
+        self.velocity = velocity
+        self.y += velocity
         self.flap_cooldown -= dt
         
         # Update rotation based on velocity
-        self.rotation = min(90, max(-30, self.velocity * 3))
+        self.rotation = min(90, max(-30, velocity * 3))
         
         # Update particles
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update(dt)
     
-    def draw(self, surface: pygame.Surface):
-        # Draw bird body (circle)
-        pygame.draw.circle(surface, COLOR_BIRD, (int(self.x), int(self.y)), self.size)
-        pygame.draw.circle(surface, COLOR_BIRD_DARK, (int(self.x), int(self.y)), self.size, 2)
-        
-        # Draw eye
-        eye_offset_x = math.cos(math.radians(self.rotation)) * 6
-        eye_offset_y = -4
-        eye_x = int(self.x + eye_offset_x)
-        eye_y = int(self.y + eye_offset_y)
-        pygame.draw.circle(surface, (0, 0, 0), (eye_x, eye_y), 3)
-        pygame.draw.circle(surface, (255, 255, 255), (eye_x - 1, eye_y - 1), 1)
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0):
+        # Blend between the last two physics steps for smooth rendering
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        rotation = self.prev_rotation + (self.rotation - self.prev_rotation) * alpha
         
-        # Draw wing
-        wing_points = [
-            (self.x + 8, self.y - 2),
-            (self.x + 18, self.y - 5),
-            (self.x + 15, self.y + 5)
-        ]
-        pygame.draw.polygon(surface, COLOR_BIRD_DARK, wing_points)
+        # Blit the pre-rendered bird for the current 5 degree rotation step
+        sprite = Bird._rotations[(int(rotation) + 30) // 5]
+        surface.blit(sprite, sprite.get_rect(center=(int(self.x), int(y))))
         
         # Draw particles
-        for particle in self.particles:
-            particle.draw(surface)
-    
-    def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(self.x - self.size, self.y - self.size, 
-                          self.size * 2, self.size * 2)
+        self.particles.draw(surface)
 
 class Pipe:
+    __slots__ = ("x", "prev_x", "gap_y", "width", "top_surf", "bot_surf")
+    
     def __init__(self, x: float, gap_y: float):
         self.x = x
+        self.prev_x = x
         self.gap_y = gap_y
-        self.width = 50
-        self.passed = False
+        self.width = PIPE_WIDTH
+        self.top_surf, self.bot_surf = Pipe.render_surfaces(int(gap_y))
     
     def update(self, dt: float):
         self.x += PIPE_VELOCITY
     
-    def draw(self, surface: pygame.Surface):
-        # Draw top pipe
-        top_height = self.gap_y
-        pygame.draw.rect(surface, COLOR_PIPE, (self.x, 0, self.width, top_height))
-        pygame.draw.rect(surface, COLOR_PIPE_DARK, (self.x, 0, self.width, top_height), 2)
-        
-        # Draw pipe shine effect
-        pygame.draw.line(surface, COLOR_PIPE_SHINE, (self.x + 5, 0), 
-                        (self.x + 5, top_height), 1)
-        
-        # Draw bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP
-        bottom_height = SCREEN_HEIGHT - bottom_y
-        pygame.draw.rect(surface, COLOR_PIPE, (self.x, bottom_y, self.width, bottom_height))
-        pygame.draw.rect(surface, COLOR_PIPE_DARK, (self.x, bottom_y, self.width, bottom_height), 2)
-        
-        # Draw pipe shine effect
-        pygame.draw.line(surface, COLOR_PIPE_SHINE, (self.x + 5, bottom_y), 
-                        (self.x + 5, bottom_y + bottom_height), 1)
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def render_surfaces(gap_y: int) -> Tuple[pygame.Surface, pygame.Surface]:
+        # Pipe artwork depends only on the gap position, so pipes share their surfaces
+        surfaces = []
+        for height in (gap_y, SCREEN_HEIGHT - gap_y - PIPE_GAP):
+            pipe_surface = pygame.Surface((PIPE_WIDTH, height)).convert()
+            pygame.draw.rect(pipe_surface, COLOR_PIPE, (0, 0, PIPE_WIDTH, height))
+            pygame.draw.rect(pipe_surface, COLOR_PIPE_DARK, (0, 0, PIPE_WIDTH, height), 2)
+            
+            # Draw pipe shine effect
+            pygame.draw.line(pipe_surface, COLOR_PIPE_SHINE, (5, 0), (5, height), 1)
+            surfaces.append(pipe_surface)
+        return surfaces[0], surfaces[1]
+    
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0):
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        surface.blit(self.top_surf, (x, 0))
+        surface.blit(self.bot_surf, (x, self.gap_y + PIPE_GAP))
     
     def is_off_screen(self) -> bool:
         return self.x + self.width < 0
     
     def collides_with(self, bird: Bird) -> bool:
-        bird_rect = bird.get_rect()
-        
-        # Check collision with top pipe
-        if bird_rect.top < self.gap_y and bird_rect.left < self.x + self.width and bird_rect.right > self.x:
-            return True
-        
-        # Check collision with bottom pipe
-        if bird_rect.bottom > self.gap_y + PIPE_GAP and bird_rect.left < self.x + self.width and bird_rect.right > self.x:
-            return True
-        
-        return False
+        # Plain AABB test; no Rect objects needed for a pipe pair
+        if bird.x + bird.size <= self.x or bird.x - bird.size >= self.x + self.width:
+            return False
+        return bird.y - bird.size < self.gap_y or bird.y + bird.size > self.gap_y + PIPE_GAP
 
 class Game:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Flappy Bird - First Edition")
+        # Frames are composed off-screen so screen shake is just an offset blit
+        self._scene = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         self.clock = pygame.time.Clock()
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 32)
         self.font_tiny = pygame.font.Font(None, 24)
+        _FONTS.update(large=self.font_large, medium=self.font_medium,
+                      small=self.font_small, tiny=self.font_tiny)
         
         self.state = GameState.MENU
         self.score = 0
         self.high_score = 0
-        self.particles: List[Particle] = []
+        self.particles = ParticleSystem()
         self.pipe_spawn_timer = 0
         self.pipe_spawn_interval = 2.0
+        self.bg_surface = self.create_background()
+        
+        # Pre-render the static overlay screens; only scores are rendered on demand
+        self._menu_overlay = self.create_overlay(180)
+        self._menu_title = _render_text("large", "FLAPPY", COLOR_SCORE)
+        self._menu_subtitle = _render_text("medium", "BIRD", COLOR_BIRD)
+        self._menu_instr = _render_text("small", "SPACE or CLICK to START", COLOR_TEXT)
+        self._menu_controls = _render_text("tiny", "SPACE/UP/W to Flap | ESC to Pause", COLOR_TEXT)
+        self._gameover_overlay = self.create_overlay(200)
+        self._gameover_text = _render_text("large", "GAME OVER", (255, 100, 100))
+        self._gameover_restart = _render_text("small", "SPACE or CLICK to Retry", COLOR_TEXT)
+        self._paused_overlay = self.create_overlay(150)
+        self._paused_text = _render_text("large", "PAUSED", COLOR_TEXT)
+        self._paused_resume = _render_text("small", "ESC to Resume", COLOR_TEXT)
+        
+        # Only queue the events we react to, and dispatch them by (state, key)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(INPUT_EVENTS)
+        self.key_actions = {}
+        for key in (pygame.K_SPACE, pygame.K_UP, pygame.K_w):
+            self.key_actions[(GameState.MENU, key)] = self.start_game
+            self.key_actions[(GameState.PLAYING, key)] = self.flap_bird
+            self.key_actions[(GameState.GAME_OVER, key)] = self.return_to_menu
+        self.key_actions[(GameState.PLAYING, pygame.K_ESCAPE)] = self.pause_game
+        self.key_actions[(GameState.PAUSED, pygame.K_ESCAPE)] = self.resume_game
+        self.click_actions = {
+            GameState.MENU: self.start_game,
+            GameState.PLAYING: self.flap_bird,
+            GameState.GAME_OVER: self.start_game,
+        }
         
         self.reset_game()
     
     def reset_game(self):
         self.bird = Bird(SCREEN_WIDTH // 4, SCREEN_HEIGHT // 2)
-        self.pipes: List[Pipe] = []
+        self.pipes: Deque[Pipe] = deque()
+        self.next_unpassed_pipe = 0
         self.score = 0
-        self.particle_system: List[Particle] = []
         self.pipe_spawn_timer = self.pipe_spawn_interval
         self.shake_intensity = 0
+        self.shake_amplitude = 0
+        self.shake_offset = (0, 0)
         self.frame_count = 0
     
+    def create_background(self) -> pygame.Surface:
+        # The sky and ground never change, so render them once and blit per frame
+        # Draw background gradient effect: smoothscale interpolates between the
+        # two endpoint pixels of a 1x2 surface in a single C pass
+        gradient = pygame.Surface((1, 2))
+        gradient.set_at((0, 0), COLOR_BG_LIGHT)
+        gradient.set_at((0, 1), COLOR_BG_ACCENT)
+        background = pygame.transform.smoothscale(gradient, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        
+        # Draw decorative ground
+        pygame.draw.rect(background, COLOR_GROUND, (0, SCREEN_HEIGHT - 40, SCREEN_WIDTH, 40))
+        pygame.draw.rect(background, COLOR_GROUND_DARK, (0, SCREEN_HEIGHT - 40, SCREEN_WIDTH, 40), 2)
+        
+        # Draw grass pattern
+        for i in range(0, SCREEN_WIDTH, 20):
+            pygame.draw.polygon(background, COLOR_GROUND_DARK, [
+                (i, SCREEN_HEIGHT - 40),
+                (i + 10, SCREEN_HEIGHT - 35),
+                (i + 20, SCREEN_HEIGHT - 40)
+            ])
+        
+        return background
+    
+    def create_overlay(self, alpha: int) -> pygame.Surface:
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        overlay.fill((0, 0, 0, alpha))
+        return overlay
+    
     def spawn_pipe(self):
         gap_y = random.randint(MIN_PIPE_HEIGHT, MAX_PIPE_HEIGHT)
         self.pipes.append(Pipe(SCREEN_WIDTH + 50, gap_y))
     
+    def start_game(self):
+        self.state = GameState.PLAYING
+        self.reset_game()
+    
+    def flap_bird(self):
+        self.bird.flap()
+    
+    def return_to_menu(self):
+        self.state = GameState.MENU
+    
+    def pause_game(self):
+        self.state = GameState.PAUSED
+    
+    def resume_game(self):
+        self.state = GameState.PLAYING
+    
     def handle_input(self):
-        for event in pygame.event.get():
+        for event in pygame.event.get(INPUT_EVENTS):
             if event.type == pygame.QUIT:
                 return False
             
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE or event.key == pygame.K_UP or event.key == pygame.K_w:
-                    if self.state == GameState.MENU:
-                        self.state = GameState.PLAYING
-                        self.reset_game()
-                    elif self.state == GameState.PLAYING:
-                        self.bird.flap()
-                    elif self.state == GameState.GAME_OVER:
-                        self.state = GameState.MENU
-                
-                if event.key == pygame.K_ESCAPE:
-                    if self.state == GameState.PLAYING:
-                        self.state = GameState.PAUSED
-                    elif self.state == GameState.PAUSED:
-                        self.state = GameState.PLAYING
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.state == GameState.MENU or self.state == GameState.GAME_OVER:
-                    self.state = GameState.PLAYING
-                    self.reset_game()
-                elif self.state == GameState.PLAYING:
-                    self.bird.flap()
+                action = self.key_actions.get((self.state, event.key))
+            else:
+                action = self.click_actions.get(self.state)
+            if action is not None:
+                action()
         
         return True
     
     def update(self, dt: float):
+        # Remember where things were before this step so draw() can interpolate
+        self.bird.prev_y = self.bird.y
+        self.bird.prev_rotation = self.bird.rotation
+        for pipe in self.pipes:
+            pipe.prev_x = pipe.x
+        
         if self.state == GameState.PLAYING:
             # Update bird
             self.bird.update(dt)
@@ -251,8 +451,10 @@ class Game:
             for pipe in self.pipes:
                 pipe.update(dt)
             
-            # Remove off-screen pipes
-            self.pipes = [p for p in self.pipes if not p.is_off_screen()]
+            # Remove off-screen pipes (always already passed, so shift the index)
+            while self.pipes and self.pipes[0].is_off_screen():
+                self.pipes.popleft()
+                self.next_unpassed_pipe -= 1
             
             # Spawn new pipes
             self.pipe_spawn_timer -= dt
@@ -260,14 +462,17 @@ class Game:
                 self.spawn_pipe()
                 self.pipe_spawn_timer = self.pipe_spawn_interval
             
-            # Check collisions with pipes
+            # Check collisions with pipes. Pipes are ordered left to right and spaced
+            # far apart, so only the first one not yet behind the bird can overlap it.
             for pipe in self.pipes:
-                if pipe.collides_with(self.bird):
-                    self.state = GameState.GAME_OVER
-                    self.shake_intensity = 0.1
-                    self.create_collision_particles(self.bird.x, self.bird.y)
-                    if self.score > self.high_score:
-                        self.high_score = self.score
+                if pipe.x + pipe.width >= self.bird.x - self.bird.size:
+                    if pipe.collides_with(self.bird):
+                        self.state = GameState.GAME_OVER
+                        self.shake_intensity = 0.1
+                        self.create_collision_particles(self.bird.x, self.bird.y)
+                        if self.score > self.high_score:
+                            self.high_score = self.score
+                    break
             
             # Check collision with ground or ceiling
             if self.bird.y - self.bird.size <= 0 or self.bird.y + self.bird.size >= SCREEN_HEIGHT:
@@ -277,87 +482,66 @@ class Game:
                 if self.score > self.high_score:
                     self.high_score = self.score
             
-            # Check if bird passed a pipe
-            for pipe in self.pipes:
-                if not pipe.passed and pipe.x + pipe.width < self.bird.x:
-                    pipe.passed = True
+            # Check if bird passed the next pipe
+            if self.next_unpassed_pipe < len(self.pipes):
+                pipe = self.pipes[self.next_unpassed_pipe]
+                if pipe.x + pipe.width < self.bird.x:
+                    self.next_unpassed_pipe += 1
                     self.score += 1
                     self.create_score_particles(SCREEN_WIDTH // 2, 50)
         
         # Update particles
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update(dt)
         
         # Update screen shake
         self.shake_intensity *= 0.95
     
     def create_collision_particles(self, x: float, y: float):
-        for _ in range(10):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 8)
-            color = (random.randint(200, 255), random.randint(100, 200), random.randint(50, 150))
-            self.particles.append(Particle(
-                x, y,
-                math.cos(angle) * speed,
-                math.sin(angle) * speed,
-                random.uniform(3, 6),
-                0.8,
-                color
-            ))
+        colors = np.array(COLOR_SPARKS, dtype=np.uint8)[np.random.randint(len(COLOR_SPARKS), size=10)]
+        self.particles.spawn_burst(
+            10, x, y,
+            (0, 2 * math.pi), (3, 8), (3, 6),
+            0.8,
+            colors
+        )
     
     def create_score_particles(self, x: float, y: float):
-        for _ in range(5):
-            angle = random.uniform(-math.pi/2, -math.pi/4)
-            speed = random.uniform(2, 4)
-            self.particles.append(Particle(
-                x, y,
-                math.cos(angle) * speed,
-                math.sin(angle) * speed,
-                random.uniform(2, 4),
-                1.0,
-                COLOR_SCORE
-            ))
-    
-    def draw(self):
-        # Draw background
-        self.screen.fill(COLOR_BG_LIGHT)
-        
-        # Draw background gradient effect
-        for i in range(SCREEN_HEIGHT):
-            color_ratio = i / SCREEN_HEIGHT
-            r = int(COLOR_BG_LIGHT[0] * (1 - color_ratio) + COLOR_BG_ACCENT[0] * color_ratio)
-            g = int(COLOR_BG_LIGHT[1] * (1 - color_ratio) + COLOR_BG_ACCENT[1] * color_ratio)
-            b = int(COLOR_BG_LIGHT[2] * (1 - color_ratio) + COLOR_BG_ACCENT[2] * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, i), (SCREEN_WIDTH, i))
-        
-        # Draw decorative ground
-        pygame.draw.rect(self.screen, COLOR_GROUND, (0, SCREEN_HEIGHT - 40, SCREEN_WIDTH, 40))
-        pygame.draw.rect(self.screen, COLOR_GROUND_DARK, (0, SCREEN_HEIGHT - 40, SCREEN_WIDTH, 40), 2)
-        
-        # Draw grass pattern
-        for i in range(0, SCREEN_WIDTH, 20):
-            pygame.draw.polygon(self.screen, COLOR_GROUND_DARK, [
-                (i, SCREEN_HEIGHT - 40),
-                (i + 10, SCREEN_HEIGHT - 35),
-                (i + 20, SCREEN_HEIGHT - 40)
-            ])
+        self.particles.spawn_burst(
+            5, x, y,
+            (-math.pi/2, -math.pi/4), (2, 4), (2, 4),
+            1.0,
+            COLOR_SCORE
+        )
+    
+    def get_shake_offset(self) -> Tuple[int, int]:
+        # Only pick a new offset when the shake amplitude steps to another integer
+        amplitude = int(self.shake_intensity * 5)
+        if amplitude != self.shake_amplitude:
+            self.shake_amplitude = amplitude
+            if amplitude > 0:
+                self.shake_offset = (random.randint(-amplitude, amplitude),
+                                     random.randint(-amplitude, amplitude))
+            else:
+                self.shake_offset = (0, 0)
+        return self.shake_offset
+    
+    def draw(self, alpha: float = 1.0):
+        # Draw static background (sky gradient and ground)
+        self._scene.blit(self.bg_surface, (0, 0))
         
         # Draw pipes
         for pipe in self.pipes:
-            pipe.draw(self.screen)
+            pipe.draw(self._scene, alpha)
         
         # Draw bird
-        self.bird.draw(self.screen)
+        self.bird.draw(self._scene, alpha)
         
         # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self._scene)
         
         # Draw score
-        score_text = self.font_medium.render(str(self.score), True, COLOR_SCORE)
-        self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 30))
+        score_text = _render_text("medium", str(self.score), COLOR_SCORE)
+        self._scene.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 30))
         
         # Draw game state UI
         if self.state == GameState.MENU:
@@ -367,85 +551,73 @@ class Game:
         elif self.state == GameState.PAUSED:
             self.draw_paused()
         
-        # Apply screen shake effect
-        if self.shake_intensity > 0:
-            shake_x = random.randint(-int(self.shake_intensity * 5), int(self.shake_intensity * 5))
-            shake_y = random.randint(-int(self.shake_intensity * 5), int(self.shake_intensity * 5))
-            temp_surface = self.screen.copy()
+        # Present the scene, offset by the screen shake
+        shake_x, shake_y = self.get_shake_offset()
+        if shake_x or shake_y:
             self.screen.fill(COLOR_BG_LIGHT)
-            self.screen.blit(temp_surface, (shake_x, shake_y))
+        self.screen.blit(self._scene, (shake_x, shake_y))
         
         pygame.display.flip()
     
     def draw_menu(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self._scene.blit(self._menu_overlay, (0, 0))
         
         # Title
-        title = self.font_large.render("FLAPPY", True, COLOR_SCORE)
-        self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 80))
-        
-        subtitle = self.font_medium.render("BIRD", True, COLOR_BIRD)
-        self.screen.blit(subtitle, (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 150))
+        self._scene.blit(self._menu_title, (SCREEN_WIDTH // 2 - self._menu_title.get_width() // 2, 80))
+        self._scene.blit(self._menu_subtitle, (SCREEN_WIDTH // 2 - self._menu_subtitle.get_width() // 2, 150))
         
         # Instructions
-        instructions = self.font_small.render("SPACE or CLICK to START", True, COLOR_TEXT)
-        self.screen.blit(instructions, (SCREEN_WIDTH // 2 - instructions.get_width() // 2, 300))
-        
-        controls = self.font_tiny.render("SPACE/UP/W to Flap | ESC to Pause", True, COLOR_TEXT)
-        self.screen.blit(controls, (SCREEN_WIDTH // 2 - controls.get_width() // 2, 380))
+        self._scene.blit(self._menu_instr, (SCREEN_WIDTH // 2 - self._menu_instr.get_width() // 2, 300))
+        self._scene.blit(self._menu_controls, (SCREEN_WIDTH // 2 - self._menu_controls.get_width() // 2, 380))
         
-        high_score_text = self.font_small.render(f"Best: {self.high_score}", True, COLOR_SCORE)
-        self.screen.blit(high_score_text, (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, 450))
+        high_score_text = _render_text("small", f"Best: {self.high_score}", COLOR_SCORE)
+        self._scene.blit(high_score_text, (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, 450))
     
     def draw_game_over(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self._scene.blit(self._gameover_overlay, (0, 0))
         
         # Game Over text
-        game_over_text = self.font_large.render("GAME OVER", True, (255, 100, 100))
-        self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 100))
+        self._scene.blit(self._gameover_text, (SCREEN_WIDTH // 2 - self._gameover_text.get_width() // 2, 100))
         
         # Score display
-        score_text = self.font_medium.render(f"Score: {self.score}", True, COLOR_SCORE)
-        self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 220))
+        score_text = _render_text("medium", f"Score: {self.score}", COLOR_SCORE)
+        self._scene.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 220))
         
-        high_score_text = self.font_medium.render(f"Best: {self.high_score}", True, COLOR_TEXT)
-        self.screen.blit(high_score_text, (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, 300))
+        high_score_text = _render_text("medium", f"Best: {self.high_score}", COLOR_TEXT)
+        self._scene.blit(high_score_text, (SCREEN_WIDTH // 2 - high_score_text.get_width() // 2, 300))
         
         # Restart instruction
-        restart_text = self.font_small.render("SPACE or CLICK to Retry", True, COLOR_TEXT)
-        self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, 420))
+        self._scene.blit(self._gameover_restart, (SCREEN_WIDTH // 2 - self._gameover_restart.get_width() // 2, 420))
     
     def draw_paused(self):
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self._scene.blit(self._paused_overlay, (0, 0))
         
         # Paused text
-        paused_text = self.font_large.render("PAUSED", True, COLOR_TEXT)
-        self.screen.blit(paused_text, (SCREEN_WIDTH // 2 - paused_text.get_width() // 2, 200))
+        self._scene.blit(self._paused_text, (SCREEN_WIDTH // 2 - self._paused_text.get_width() // 2, 200))
         
         # Resume instruction
-        resume_text = self.font_small.render("ESC to Resume", True, COLOR_TEXT)
-        self.screen.blit(resume_text, (SCREEN_WIDTH // 2 - resume_text.get_width() // 2, 350))
+        self._scene.blit(self._paused_resume, (SCREEN_WIDTH // 2 - self._paused_resume.get_width() // 2, 350))
     
     def run(self):
         running = True
+        accumulator = 0.0
         while running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            # Frame time in seconds, clamped so a long stall can't queue up many steps
+            frame_time = min(self.clock.tick(RENDER_FPS) / 1000.0, MAX_FRAME_TIME)
             
             running = self.handle_input()
-            self.update(dt)
-            self.draw()
+            
+            # Physics constants are per tick, so simulate in fixed steps of 1/FPS
+            accumulator += frame_time
+            while accumulator >= PHYSICS_STEP:
+                self.update(PHYSICS_STEP)
+                accumulator -= PHYSICS_STEP
+            
+            # Render every pass, blended by how far we are into the next step
+            self.draw(accumulator / PHYSICS_STEP)
         
         pygame.quit()
         sys.exit()